@@ -27,9 +27,13 @@
 #
 ###################################################################
 
-import io
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import os
+from pathlib import Path
 import shutil
+import tempfile
+import threading
 import zipfile
 
 import click
@@ -44,6 +48,45 @@ USERDIR = get_userdir()
 JSON_FG_FILES = get_userdir()
 
 
+def extract_zipfile(filename: str, destination: Path) -> None:
+    """
+    Helper function to extract a ZIP archive, with entries extracted
+    concurrently (one `zipfile.ZipFile` handle per worker thread)
+
+    :param filename: path to ZIP archive
+    :param destination: directory to extract to
+
+    :returns: `None`
+    """
+
+    local = threading.local()
+    handles = []
+
+    def extract(info: zipfile.ZipInfo) -> None:
+        if not hasattr(local, 'zipfile'):
+            local.zipfile = zipfile.ZipFile(filename)
+            handles.append(local.zipfile)
+        local.zipfile.extract(info, destination)
+
+    with zipfile.ZipFile(filename) as z:
+        infos = z.infolist()
+
+    # create directories up front so that workers do not race on them
+    destination = destination.resolve()
+    for info in infos:
+        path = (destination / info.filename).resolve()
+        if path.is_relative_to(destination):
+            directory = path if info.is_dir() else path.parent
+            directory.mkdir(parents=True, exist_ok=True)
+
+    try:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            list(executor.map(extract, infos))
+    finally:
+        for handle in handles:
+            handle.close()
+
+
 @click.group()
 def bundle():
     """Configuration bundle management"""
@@ -66,9 +109,18 @@ def sync(ctx, logfile, verbosity):
     JSON_FG_FILES.mkdir(parents=True, exist_ok=True)
 
     URL = 'https://beta.schemas.opengis.net/json-fg/json-fg-0_1_1.zip'
-    FH = io.BytesIO(urlopen_(URL).read())
-    with zipfile.ZipFile(FH) as z:
-        z.extractall(JSON_FG_FILES)
+
+    with tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as tmp:
+        tmp_path = tmp.name
+
+    try:
+        with open(tmp_path, 'wb') as fh:
+            shutil.copyfileobj(urlopen_(URL, buffered=True), fh,
+                               length=1 << 20)
+
+        extract_zipfile(tmp_path, JSON_FG_FILES)
+    finally:
+        os.unlink(tmp_path)
 
 
 bundle.add_command(sync)
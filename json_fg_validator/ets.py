@@ -27,8 +27,8 @@
 #
 ###################################################################
 
-from io import BytesIO
 import json
+import sys
 
 import click
 
@@ -36,6 +36,8 @@ from json_fg_validator.json_fg.ets import JSONFGTestSuite
 from json_fg_validator.util import (get_cli_common_options, parse_json_fg,
                                     setup_logger, urlopen_)
 
+JSON_FG_TYPES = ['Feature', 'FeatureCollection']
+
 
 @click.group()
 def ets():
@@ -58,10 +60,13 @@ def validate(ctx, file_or_url, logfile, verbosity,
 
     click.echo(f'Opening {file_or_url}')
 
-    if file_or_url.startswith('http'):
-        content = BytesIO(urlopen_(file_or_url).read())
-    else:
-        content = file_or_url
+    try:
+        if file_or_url.startswith('http'):
+            content = urlopen_(file_or_url, buffered=True).read()
+        else:
+            content = file_or_url
+    except Exception as err:
+        raise click.ClickException(err)
 
     click.echo(f'Validating {file_or_url}')
 
@@ -70,7 +75,13 @@ def validate(ctx, file_or_url, logfile, verbosity,
     except Exception as err:
         raise click.ClickException(err)
 
-    click.echo('Detected JSON FG')
+    type_ = data.get('type') if isinstance(data, dict) else None
+
+    if type_ not in JSON_FG_TYPES:
+        raise click.ClickException(f'Unsupported JSON FG type: {type_}')
+
+    click.echo(f'Detected JSON FG {type_}')
+
     ts = JSONFGTestSuite(data)
     try:
         results = ts.run_tests(fail_on_schema_validation)
@@ -80,4 +91,47 @@ def validate(ctx, file_or_url, logfile, verbosity,
     click.echo(json.dumps(results, indent=4))
 
 
+@click.command()
+@click.pass_context
+@get_cli_common_options
+@click.option('--fail-on-schema-validation/--no-fail-on-schema-validation',
+              '-f', default=True,
+              help='Stop the ETS on failing schema validation')
+def serve(ctx, logfile, verbosity, fail_on_schema_validation=True):
+    """validate documents from stdin (one file, URL or JSON per line)"""
+
+    # stdout carries the reports, so log to stderr unless logging to file
+    setup_logger(verbosity, logfile, stream=sys.stderr)
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            if line.startswith(('{', '[')):
+                content = line.encode('utf-8')
+            elif line.startswith('http'):
+                content = urlopen_(line, buffered=True).read()
+            else:
+                content = line
+
+            data = parse_json_fg(content)
+
+            if not isinstance(data, dict):
+                raise RuntimeError('JSON FG document must be a JSON object')
+
+            if data.get('type') not in JSON_FG_TYPES:
+                raise RuntimeError(
+                    f"Unsupported JSON FG type: {data.get('type')}")
+
+            ts = JSONFGTestSuite(data)
+            results = ts.run_tests(fail_on_schema_validation)
+        except Exception as err:
+            results = {'error': str(err)}
+
+        click.echo(json.dumps(results))
+
+
 ets.add_command(validate)
+ets.add_command(serve)
@@ -27,17 +27,28 @@
 #
 ###################################################################
 
+from collections import Counter
+from datetime import datetime
+from functools import cached_property, lru_cache, wraps
+from itertools import islice
 import json
 import logging
+from typing import Callable, Optional
 
 from dateutil.parser import parse as dateutil_parse
 from jsonschema.validators import Draft202012Validator
+import shapely
 from shapely.geometry import shape
 
 from json_fg_validator.bundle import JSON_FG_FILES
 
 LOGGER = logging.getLogger(__name__)
 
+CONFORMANCE_CLASSES = frozenset([
+    'http://www.opengis.net/spec/json-fg-1/0.2/conf/core',
+    '[ogc-json-fg-1-0.2:core]'
+])
+
 
 def gen_test_id(test_id: str) -> str:
     """
@@ -51,6 +62,75 @@ def gen_test_id(test_id: str) -> str:
     return f'http://www.opengis.net/spec/json-fg-1/0.2/{test_id}'
 
 
+def _parse_rfc3339(value: str) -> datetime:
+    """
+    Helper function to parse an RFC3339 date or timestamp
+
+    :param value: RFC3339 date or timestamp
+
+    :returns: `datetime.datetime`
+    """
+
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return dateutil_parse(value)
+
+
+@lru_cache(maxsize=4)
+def _get_validator(schema_path: str) -> Draft202012Validator:
+    """
+    Helper function to load a JSON Schema and build its validator once
+
+    :param schema_path: path to JSON Schema file
+
+    :returns: `jsonschema.validators.Draft202012Validator`
+    """
+
+    LOGGER.debug(f'Loading schema {schema_path}')
+    with open(schema_path) as fh:
+        schema = json.load(fh)
+
+    Draft202012Validator.check_schema(schema)
+
+    return Draft202012Validator(schema)
+
+
+def ets_test(test_id: str, requires: Optional[str] = None) -> Callable:
+    """
+    Decorator to register a method as an ETS test
+
+    The test method is called with an initial (PASSED) status for
+    `test_id` as its first argument.
+
+    :param test_id: test suite identifier
+    :param requires: JSON FG member the test needs (test is skipped
+                     without being called if the member is null/missing)
+
+    :returns: decorator registering the test method as an ETS test
+    """
+
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(self, *args, **kwargs) -> dict:
+            status = {
+                'id': gen_test_id(test_id),
+                'code': 'PASSED'
+            }
+
+            if requires is not None and self.data.get(requires) is None:
+                status['code'] = 'SKIPPED'
+                status['message'] = f'{requires.capitalize()} is null'
+                return status
+
+            return function(self, status, *args, **kwargs)
+
+        wrapper._is_ets = True
+        return wrapper
+
+    return decorator
+
+
 class JSONFGTestSuite:
     """Test suite for JSON FG"""
 
@@ -67,36 +147,85 @@ class JSONFGTestSuite:
         self.data = data
         self.report = []
 
+    @cached_property
+    def _parsed_time(self) -> Optional[dict]:
+        """
+        Temporal values, parsed once on first access and shared by all tests
+
+        :returns: `dict` of parsed `date`, `timestamp` and `interval`
+                  values, or `None` if time is null
+        """
+
+        time_ = self.data.get('time')
+        if time_ is None:
+            return None
+
+        parsed_time = {}
+        for key in ['date', 'timestamp']:
+            if key in time_:
+                parsed_time[key] = _parse_rfc3339(time_[key])
+        if 'interval' in time_:
+            parsed_time['interval'] = [
+                None if int_ == '..' else _parse_rfc3339(int_)
+                for int_ in time_['interval']
+            ]
+
+        return parsed_time
+
+    @cached_property
+    def _shape(self):
+        """
+        Geometry, built once on first access and shared by all tests
+
+        :returns: shapely geometry, or `None` if geometry is null
+        """
+
+        geometry = self.data.get('geometry')
+        if geometry is None:
+            return None
+
+        return shape(geometry)
+
+    @cached_property
+    def _coords(self):
+        """
+        Geometry coordinate array, built once on first access
+
+        :returns: `numpy.ndarray` of coordinates, or `None` if geometry
+                  is null
+        """
+
+        if self._shape is None:
+            return None
+
+        return shapely.get_coordinates(self._shape, include_z=True)
+
     def run_tests(self, fail_on_schema_validation=False):
         """Convenience function to run all tests"""
 
         results = []
-        tests = []
         ets_report = {
             'summary': {},
         }
 
-        for f in dir(JSONFGTestSuite):
-            if all([
-                    callable(getattr(JSONFGTestSuite, f)),
-                    f.startswith('test_requirement')]):
-
-                tests.append(f)
-
-        validation_result = self.test_requirement_validation()
+        validation_result = self.test_requirement_validation(
+            fail_on_schema_validation)
         if validation_result['code'] == 'FAILED':
             if fail_on_schema_validation:
-                msg = ('Record fails JSON FG validation. Stopping ETS ',
-                       f"errors: {validation_result['errors']}")
+                msg = ('Record fails JSON FG validation. Stopping ETS. '
+                       f"Errors: {validation_result['errors']}")
                 LOGGER.error(msg)
                 raise ValueError(msg)
 
-        for t in tests:
-            results.append(getattr(self, t)())
+        for t in self._TESTS:
+            if t == 'test_requirement_validation':
+                results.append(validation_result)
+            else:
+                results.append(getattr(self, t)())
 
+        codes = Counter(r['code'] for r in results)
         for code in ['PASSED', 'FAILED', 'SKIPPED']:
-            r = len([t for t in results if t['code'] == code])
-            ets_report['summary'][code] = r
+            ets_report['summary'][code] = codes[code]
 
         ets_report['tests'] = results
 
@@ -104,19 +233,19 @@ class JSONFGTestSuite:
             'ets-report': ets_report
         }
 
-    def test_requirement_validation(self):
+    @ets_test('req/core/schema-valid')
+    def test_requirement_validation(self, status,
+                                    fail_on_schema_validation=False):
         """
         Validate that a JSON FG record is valid to the authoritative
         JSON-FG schema
+
+        :param status: initial test status (provided by `ets_test`)
+        :param fail_on_schema_validation: stop at the first validation error
         """
 
         validation_errors = []
 
-        status = {
-            'id': gen_test_id('req/core/schema-valid'),
-            'code': 'PASSED'
-        }
-
         if self.data['type'] == 'Feature':
             schema = 'feature.json'
         elif self.data['type'] == 'FeatureCollection':
@@ -129,112 +258,90 @@ class JSONFGTestSuite:
             LOGGER.error(msg)
             raise RuntimeError(msg)
 
-        with schema.open() as fh:
+        debug = LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
             LOGGER.debug(f'Validating {self.data} against {schema}')
-            validator = Draft202012Validator(json.load(fh))
 
-            for error in validator.iter_errors(self.data):
-                LOGGER.debug(f'{error.json_path}: {error.message}')
-                validation_errors.append(f'{error.json_path}: {error.message}')
+        errors = _get_validator(str(schema)).iter_errors(self.data)
 
-            if validation_errors:
-                status['code'] = 'FAILED'
-                status['message'] = f'{len(validation_errors)} error(s)'
-                status['errors'] = validation_errors
+        if fail_on_schema_validation:
+            errors = islice(errors, 1)
+
+        append = validation_errors.append
+        for error in errors:
+            error_message = f'{error.json_path}: {error.message}'
+            if debug:
+                LOGGER.debug(error_message)
+            append(error_message)
+
+        if validation_errors:
+            status['code'] = 'FAILED'
+            status['message'] = f'{len(validation_errors)} error(s)'
+            if fail_on_schema_validation:
+                status['message'] += ' (stopped at first error)'
+            status['errors'] = validation_errors
 
         return status
 
-    def test_requirement_conformance(self):
+    @ets_test('req/core/metadata')
+    def test_requirement_conformance(self, status):
         """
         Validate that a JSON FG provides valid conformance information.
         """
 
-        found = False
-
-        status = {
-            'id': gen_test_id('req/core/metadata'),
-            'code': 'PASSED'
-        }
-
-        conformance_classes = [
-            'http://www.opengis.net/spec/json-fg-1/0.2/conf/core',
-            '[ogc-json-fg-1-0.2:core]'
-        ]
-
         conformance = self.data.get('conformsTo')
 
         if conformance is None:
             status['code'] = 'FAILED'
             status['message'] = 'Missing conformsTo member'
-
-        for cc in conformance_classes:
-            if cc in conformance:
-                found = True
-                break
-
-        if not found:
+        elif CONFORMANCE_CLASSES.isdisjoint(conformance):
             status['code'] = 'FAILED'
             status['message'] = 'Missing valid conformsTo member'
 
         return status
 
-    def test_requirement_temporal_instant(self):
+    @ets_test('req/core/instant')
+    def test_requirement_temporal_instant(self, status):
         """
         Validate that a JSON FG provides valid temporal instant information.
         """
 
-        status = {
-            'id': gen_test_id('req/core/instant'),
-            'code': 'PASSED',
-            'message': 'Passes given data is compliant/valid to schema'
-        }
+        status['message'] = 'Passes given data is compliant/valid to schema'
 
         return status
 
-    def test_requirement_temporal_interval(self):
+    @ets_test('req/core/interval')
+    def test_requirement_temporal_interval(self, status):
         """
         Validate that a JSON FG provides valid temporal interval information.
         """
 
-        status = {
-            'id': gen_test_id('req/core/interval'),
-            'code': 'PASSED',
-            'message': 'Passes given data is compliant/valid to schema'
-        }
+        status['message'] = 'Passes given data is compliant/valid to schema'
 
         return status
 
-    def test_requirement_temporal_instant_and_interval(self):
+    @ets_test('req/core/instant-and-interval', requires='time')
+    def test_requirement_temporal_instant_and_interval(self, status):
         """
         Validate that a JSON FG provides valid temporal instant and
         interval information.
         """
 
-        status = {
-            'id': gen_test_id('req/core/instant-and-interval'),
-            'code': 'PASSED'
-        }
-
-        time_ = self.data.get('time')
-        if time_ is None:
-            status['code'] = 'SKIPPED'
-            status['message'] = 'Skipping given time is null'
-            return status
+        time_ = self._parsed_time
 
         if 'date' in time_ and 'timestamp' in time_:
-            date_ = dateutil_parse(time_['date'])
-            timestamp = dateutil_parse(time_['timestamp'])
-            if date_.date() != timestamp.date():
+            if time_['date'].date() != time_['timestamp'].date():
                 status['code'] = 'FAILED'
                 status['message'] = 'date and timestamp full-date not identical'  # noqa
 
         if 'timestamp' in time_ and 'interval' in time_:
             found1 = found2 = False
 
-            timestamp = dateutil_parse(time_['timestamp'])
+            timestamp = time_['timestamp']
 
-            for int_ in time_['interval']:
-                interval = dateutil_parse(int_)
+            for interval in time_['interval']:
+                if interval is None:
+                    continue
                 if timestamp.date() == interval.date():
                     found1 = True
                 if timestamp == interval:
@@ -251,10 +358,11 @@ class JSONFGTestSuite:
         if 'date' in time_ and 'interval' in time_:
             found1 = found2 = False
 
-            date_ = dateutil_parse(time_['date'])
+            date_ = time_['date']
 
-            for int_ in time_['interval']:
-                interval = dateutil_parse(int_)
+            for interval in time_['interval']:
+                if interval is None:
+                    continue
                 if date_.date() == interval.date():
                     found1 = True
                 if date_ == interval:
@@ -270,91 +378,67 @@ class JSONFGTestSuite:
 
         return status
 
-    def test_requirement_temporal_utc(self):
+    @ets_test('req/core/utc', requires='time')
+    def test_requirement_temporal_utc(self, status):
         """
         Validate that a JSON FG provides valid UTC information.
         """
 
         timestamps_to_validate = []
 
-        status = {
-            'id': gen_test_id('req/core/utc'),
-            'code': 'PASSED'
-        }
-
         time_ = self.data.get('time')
-
-        if time_ is None:
-            status['code'] = 'SKIPPED'
-            status['message'] = 'Time is null'
-            return status
+        parsed_time = self._parsed_time
 
         if 'timestamp' in time_:
-            timestamps_to_validate.append(time_['timestamp'])
+            timestamps_to_validate.append(parsed_time['timestamp'])
 
         if 'interval' in time_:
-            for int_ in time_['interval']:
+            for int_, interval in zip(time_['interval'],
+                                      parsed_time['interval']):
                 if len(int_) > 11:
-                    timestamps_to_validate.append(int_)
+                    timestamps_to_validate.append(interval)
 
-        for ttv in timestamps_to_validate:
-            ts = dateutil_parse(ttv)
+        for ts in timestamps_to_validate:
             if ts.tzname() != 'UTC':
                 status['code'] = 'FAILED'
                 status['message'] = 'Timestamp is not in UTC format'
 
         return status
 
-    def test_requirement_coordinate_dimension(self):
+    @ets_test('req/core/coordinate-dimension', requires='geometry')
+    def test_requirement_coordinate_dimension(self, status):
         """
         Validate that a JSON FG provides valid coordinate dimensions
         """
 
-        status = {
-            'id': gen_test_id('req/core/coordinate-dimension'),
-            'code': 'PASSED'
-        }
+        parts = getattr(self._shape, 'geoms', [self._shape])
 
-        geometry = self.data.get('geometry')
-        if geometry is None:
-            status['code'] = 'SKIPPED'
-            status['message'] = 'Geometry is null'
-        else:
-            coord_dims = []
-            g = shape(geometry)
-            for c in g.coords:
-                coord_dims.append(len(c))
-
-            if len(set(coord_dims)) > 1:
-                status['code'] = 'FAILED'
-                status['message'] = 'Geometry dimensions are inconsistent'
-                return status
+        if len({part.has_z for part in parts}) > 1:
+            status['code'] = 'FAILED'
+            status['message'] = 'Geometry dimensions are inconsistent'
+            return status
 
         # TODO: place
         # place = self.data.get('place')
 
         return status
 
-    def test_requirement_geometry_wgs84(self):
+    @ets_test('req/core/geometry-wgs84', requires='geometry')
+    def test_requirement_geometry_wgs84(self, status):
         """
         Validate that a JSON FG provides valid WGS84 coordinates
         """
 
-        status = {
-            'id': gen_test_id('req/core/geometry-wgs84'),
-            'code': 'PASSED'
-        }
+        xy = self._coords
+        out_of_bounds = ((xy[:, 0] < -180) | (xy[:, 0] > 180) |
+                         (xy[:, 1] < -90) | (xy[:, 1] > 90))
 
-        geometry = self.data.get('geometry')
-
-        if geometry is None:
-            status['code'] = 'SKIPPED'
-            status['message'] = 'Geometry is null'
-        else:
-            g = shape(geometry)
-            for c in g.coords:
-                if (-180 > c[0] > 180) or (-90 > c[1] > 90):
-                    status['code'] = 'FAILED'
-                    status['message'] = 'Geometry coordinates are out of bounds'  # noqa
+        if out_of_bounds.any():
+            status['code'] = 'FAILED'
+            status['message'] = 'Geometry coordinates are out of bounds'
 
         return status
+
+    # ETS tests, in definition order
+    _TESTS = tuple(name for name, function in vars().items()
+                   if getattr(function, '_is_ets', False))
@@ -27,15 +27,18 @@
 #
 ###################################################################
 
-import json
+import io
 import logging
 from pathlib import Path
 import ssl
 import sys
+from typing import BinaryIO, TextIO, Union
 from urllib.error import URLError
 from urllib.request import urlopen
 from urllib.parse import urlparse
 
+import orjson
+
 LOGGER = logging.getLogger(__name__)
 THISDIR = Path(__file__).parent.resolve()
 
@@ -66,12 +69,14 @@ def get_userdir() -> str:
     return Path.home() / '.json-fg-validator'
 
 
-def setup_logger(loglevel: str = None, logfile: str = None) -> None:
+def setup_logger(loglevel: str = None, logfile: str = None,
+                 stream: TextIO = None) -> None:
     """
     Setup logging
 
     :param loglevel: logging level
     :param logfile: logfile location
+    :param stream: stream to log to if no logfile (default: stdout)
 
     :returns: void (creates logging instance)
     """
@@ -102,17 +107,19 @@ def setup_logger(loglevel: str = None, logfile: str = None) -> None:
                             format=log_format, filename=logfile)
     elif loglevel is not None:  # log to stdout
         logging.basicConfig(level=loglevel, datefmt=date_format,
-                            format=log_format, stream=sys.stdout)
+                            format=log_format, stream=stream or sys.stdout)
         LOGGER.debug('Logging initialized')
 
 
-def urlopen_(url: str):
+def urlopen_(url: str, buffered: bool = False):
     """
     Helper function for downloading a URL
 
     :param url: URL to download
+    :param buffered: whether to wrap the response in a 1 MiB read buffer
 
-    :returns: `http.client.HTTPResponse`
+    :returns: `http.client.HTTPResponse` (or `io.BufferedReader` if
+              `buffered`)
     """
 
     try:
@@ -124,6 +131,9 @@ def urlopen_(url: str):
 
         response = urlopen(url, context=context)
 
+    if buffered:
+        return io.BufferedReader(response, buffer_size=1 << 20)
+
     return response
 
 
@@ -181,20 +191,26 @@ def check_url(url: str, check_ssl: bool, timeout: int = 30) -> dict:
     return result
 
 
-def parse_json_fg(content: str) -> dict:
+def parse_json_fg(content: Union[bytes, BinaryIO, str, Path]) -> dict:
     """
     Parse a buffer into a JSON dict (JSON-FG)
 
-    :param content: str of JSON
+    :param content: bytes of JSON, binary file-like object, or filepath
+                    to JSON
 
     :returns: `dict` object of JSON FG
     """
 
     LOGGER.debug('Attempting to parse as JSON')
     try:
-        with open(content) as fh:
-            data = json.load(fh)
-    except json.decoder.JSONDecodeError as err:
+        if isinstance(content, (bytes, bytearray)):
+            data = orjson.loads(content)
+        elif hasattr(content, 'read'):
+            data = orjson.loads(content.read())
+        else:
+            with open(content, 'rb') as fh:
+                data = orjson.loads(fh.read())
+    except orjson.JSONDecodeError as err:
         LOGGER.error(err)
         raise RuntimeError(f'Encoding error: {err}')
 
@@ -27,93 +27,6 @@
 #
 ###################################################################
 
-from pathlib import Path
-import re
-from setuptools import Command, find_packages, setup
-import sys
+from setuptools import setup
 
-
-class PyTest(Command):
-    user_options = []
-
-    def initialize_options(self):
-        pass
-
-    def finalize_options(self):
-        pass
-
-    def run(self):
-        import subprocess
-        errno = subprocess.call([sys.executable, 'tests/run_tests.py'])
-        raise SystemExit(errno)
-
-
-def read(filename, encoding='utf-8'):
-    """read file contents"""
-
-    fullpath = Path(__file__).resolve().parent / filename
-
-    with fullpath.open() as fh:
-        contents = fh.read().strip()
-    return contents
-
-
-def get_package_version():
-    """get version from top-level package init"""
-    version_file = read('json_fg_validator/__init__.py')
-    version_match = re.search(r"^__version__ = ['\"]([^'\"]*)['\"]",
-                              version_file, re.M)
-    if version_match:
-        return version_match.group(1)
-    raise RuntimeError("Unable to find version string.")
-
-
-KEYWORDS = [
-    'OGC',
-    'JSON',
-    'Features and Geometry'
-]
-
-DESCRIPTION = 'OGC Features and Geometries JSON validator written in Python'
-
-MANIFEST = Path('MANIFEST')
-
-if MANIFEST.exists():
-    MANIFEST.unlink()
-
-
-setup(
-    name='json-fg-validator',
-    version=get_package_version(),
-    description=DESCRIPTION.strip(),
-    long_description=read('README.md'),
-    long_description_content_type='text/markdown',
-    license='MIT',
-    platforms='all',
-    keywords=' '.join(KEYWORDS),
-    author='Tom Kralidis',
-    author_email='tomkralidis@gmail.com',
-    maintainer='Tom Kralidis',
-    maintainer_email='tomkralidis@gmail.com',
-    url='https://github.com/tomkralidis/json-fg-validator',
-    install_requires=read('requirements.txt').splitlines(),
-    packages=find_packages(),
-    entry_points={
-        'console_scripts': [
-            'json-fg-validator=json_fg_validator:cli'
-        ]
-    },
-    classifiers=[
-        'Development Status :: 4 - Beta',
-        'Environment :: Console',
-        'Intended Audience :: Developers',
-        'Intended Audience :: Science/Research',
-        'License :: OSI Approved :: MIT',
-        'Operating System :: OS Independent',
-        'Programming Language :: Python',
-        'Topic :: Scientific/Engineering :: Atmospheric Science',
-        'Topic :: Scientific/Engineering :: GIS'
-    ],
-    cmdclass={'test': PyTest},
-    test_suite='tests.run_tests'
-)
+setup()
@@ -0,0 +1,125 @@
+###################################################################
+#
+# Authors: Tom Kralidis <tomkralidis@gmail.com>
+#
+# Copyright (c) 2023 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+###################################################################
+
+from json_fg_validator.json_fg.ets import gen_test_id, JSONFGTestSuite
+
+
+def test_gen_test_id():
+    assert gen_test_id('req/core/utc') == \
+        'http://www.opengis.net/spec/json-fg-1/0.2/req/core/utc'
+
+
+def test_tests_registered_in_order():
+    assert JSONFGTestSuite._TESTS[0] == 'test_requirement_validation'
+    assert len(JSONFGTestSuite._TESTS) == 8
+
+
+def test_skipped_without_required_member():
+    ts = JSONFGTestSuite({'type': 'Feature', 'geometry': None})
+
+    status = ts.test_requirement_geometry_wgs84()
+
+    assert status['id'] == gen_test_id('req/core/geometry-wgs84')
+    assert status['code'] == 'SKIPPED'
+    assert status['message'] == 'Geometry is null'
+
+
+def test_geometry_wgs84_out_of_bounds():
+    ts = JSONFGTestSuite({
+        'type': 'Feature',
+        'geometry': {'type': 'Point', 'coordinates': [200, 0]}
+    })
+
+    status = ts.test_requirement_geometry_wgs84()
+
+    assert status['code'] == 'FAILED'
+    assert status['message'] == 'Geometry coordinates are out of bounds'
+
+
+def test_geometry_wgs84_in_bounds():
+    ts = JSONFGTestSuite({
+        'type': 'Feature',
+        'geometry': {'type': 'Point', 'coordinates': [-75.7, 45.4]}
+    })
+
+    assert ts.test_requirement_geometry_wgs84()['code'] == 'PASSED'
+
+
+def test_polygon_geometry():
+    ts = JSONFGTestSuite({
+        'type': 'Feature',
+        'geometry': {
+            'type': 'Polygon',
+            'coordinates': [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]]
+        }
+    })
+
+    assert ts.test_requirement_geometry_wgs84()['code'] == 'PASSED'
+    assert ts.test_requirement_coordinate_dimension()['code'] == 'PASSED'
+
+
+def test_conformance_null():
+    ts = JSONFGTestSuite({'type': 'Feature', 'conformsTo': None})
+
+    status = ts.test_requirement_conformance()
+
+    assert status['code'] == 'FAILED'
+    assert status['message'] == 'Missing conformsTo member'
+
+
+def test_conformance_invalid():
+    ts = JSONFGTestSuite({'type': 'Feature', 'conformsTo': ['foo']})
+
+    status = ts.test_requirement_conformance()
+
+    assert status['code'] == 'FAILED'
+    assert status['message'] == 'Missing valid conformsTo member'
+
+
+def test_conformance_valid():
+    ts = JSONFGTestSuite({
+        'type': 'Feature',
+        'conformsTo': ['[ogc-json-fg-1-0.2:core]']
+    })
+
+    assert ts.test_requirement_conformance()['code'] == 'PASSED'
+
+
+def test_open_interval():
+    ts = JSONFGTestSuite({
+        'type': 'Feature',
+        'time': {
+            'timestamp': '2023-01-01T00:00:00Z',
+            'interval': ['2023-01-01T00:00:00Z', '..']
+        }
+    })
+
+    assert ts.test_requirement_temporal_instant_and_interval()['code'] == 'PASSED'  # noqa
+    assert ts.test_requirement_temporal_utc()['code'] == 'PASSED'
+    assert ts._parsed_time['interval'][1] is None
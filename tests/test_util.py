@@ -0,0 +1,57 @@
+###################################################################
+#
+# Authors: Tom Kralidis <tomkralidis@gmail.com>
+#
+# Copyright (c) 2023 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+###################################################################
+
+from io import BytesIO
+
+import pytest
+
+from json_fg_validator.util import parse_json_fg
+
+FEATURE = b'{"type": "Feature", "geometry": null, "properties": null}'
+
+
+def test_parse_json_fg_bytes():
+    assert parse_json_fg(FEATURE)['type'] == 'Feature'
+
+
+def test_parse_json_fg_buffer():
+    assert parse_json_fg(BytesIO(FEATURE))['type'] == 'Feature'
+
+
+def test_parse_json_fg_filepath(tmp_path):
+    filepath = tmp_path / 'feature.json'
+    filepath.write_bytes(FEATURE)
+
+    assert parse_json_fg(filepath)['type'] == 'Feature'
+    assert parse_json_fg(str(filepath))['type'] == 'Feature'
+
+
+def test_parse_json_fg_malformed():
+    with pytest.raises(RuntimeError, match='Encoding error'):
+        parse_json_fg(b'{"type": ')